@@ -50,6 +50,7 @@ class ChildStatistics:
 class CgetAndConfigure:
     _keys: dict[str, Any | tuple[Any, str]]
     _tcl_call: Callable
+    __slots__ = ()
 
     def _cget(self, key: str) -> Any:
         if isinstance(self._keys[key], tuple):
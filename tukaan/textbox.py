@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import contextlib
+import errno
+import os
 import warnings
 from collections import abc, namedtuple
-from functools import partialmethod
+from functools import lru_cache, partialmethod
 from pathlib import Path
-from typing import Any, Iterator, Optional, Type
+from typing import Any, Iterable, Iterator, Optional, Type
 
 import _tkinter as tk
 from PIL import Image  # type: ignore
@@ -20,6 +23,7 @@ from ._utils import (
     _text_tags,
     classproperty,
     counts,
+    get_tcl_interp,
     py_to_tcl_arguments,
     update_before,
 )
@@ -27,9 +31,152 @@ from ._variables import Integer
 from .exceptions import TclError
 from .scrollbar import Scrollbar
 
+_FULL_RANGE = ("1.0", "end - 1 chars")
+
+# (keyword argument, Tcl option, whether the option is used when the argument is False)
+_SEARCH_FLAGS = (
+    ("backwards", "-backwards", False),
+    ("case_sensitive", "-nocase", True),
+    ("count_hidden", "-elide", False),
+    ("exact", "-exact", False),
+    ("forwards", "-forwards", False),
+    ("match_newline", "-nolinestop", False),
+    ("regex", "-regexp", False),
+    ("strict_limits", "-strictlimits", False),
+)
+
+# Tcl procs for loops that would need a Tcl call per step from Python.
+# They're defined once, so Tcl compiles them only once: name -> (arguments, body)
+_TCL_PROCS = {
+    # runs `$widget edit $subcommand` at most `$number` times, stopping at the first error
+    "repeat_edit": (
+        "widget subcommand number",
+        """
+        for {set i 0} {$i < $number} {incr i} {
+            if {[catch {$widget edit $subcommand}]} break
+        }
+        """,
+    ),
+    # collects the start and end index of every match, instead of searching from Python
+    # one by one. If a variable name is given, it gets the length of the last match like before
+    "search_all": (
+        "widget variable options pattern start stop",
+        """
+        if {$variable ne ""} {
+            upvar #0 $variable length
+        }
+        # a backwards search finds the closest match before $start, a forward one at or after it
+        set backwards [expr {"-backwards" in $options}]
+        set wrapped [expr {$backwards ? ">=" : "<="}]
+        set previous ""
+        set result {}
+        while 1 {
+            set index [$widget search -count length {*}$options $pattern $start $stop]
+            if {$index eq ""} break
+            # stop if the search didn't move on (like with a zero-length match) or wrapped around
+            if {$previous ne "" && [$widget compare $index $wrapped $previous]} break
+            lappend result $index [$widget index "$index + $length chars"]
+            set previous $index
+            if {$backwards} {
+                set start $index
+            } else {
+                set start "$index + 1 chars"
+            }
+        }
+        return $result
+        """,
+    ),
+    "has_mark": ("widget name", "expr {$name in [$widget mark names]}"),
+    # the index of a mark, or an empty string, if there's no such mark
+    "mark_index": (
+        "widget name",
+        """
+        if {$name in [$widget mark names]} {
+            return [$widget index $name]
+        }
+        return ""
+        """,
+    ),
+    # reads the file in Tcl, so its content doesn't have to go through Python. Errors are reported
+    # like the ones from `open`, so TextBox.insert can turn them into the matching Python exception
+    "insert_file": (
+        "widget index path",
+        """
+        set file [open $path r]
+        fconfigure $file -encoding utf-8
+        try {
+            $widget insert $index [read $file]
+        } trap POSIX {- options} {
+            set reason [lindex [dict get $options -errorcode] 2]
+            return -code error [format {couldn't open "%s": %s} $path $reason]
+        } finally {
+            close $file
+        }
+        """,
+    ),
+    # counts between each start and end index pair in `indexes`
+    "count_many": (
+        "widget options indexes",
+        """
+        set result {}
+        foreach {start end} $indexes {
+            lappend result [$widget count {*}$options $start $end]
+        }
+        return $result
+        """,
+    ),
+}
+_tcl_procs_interp = None
+
+
+def _define_tcl_procs() -> None:
+    global _tcl_procs_interp
+
+    interp = get_tcl_interp()
+    if interp is _tcl_procs_interp:
+        return
+
+    interp._tcl_call(None, "namespace", "eval", "::tukaan", "")
+    for name, (args, body) in _TCL_PROCS.items():
+        interp._tcl_call(None, "proc", f"::tukaan::{name}", args, body)
+
+    _tcl_procs_interp = interp
+
+
+# Tcl's reasons for not being able to read a file -> errno codes
+_FILE_ERRORS = {
+    "no such file or directory": errno.ENOENT,
+    "permission denied": errno.EACCES,
+    "illegal operation on a directory": errno.EISDIR,
+}
+
+# (horizontal, vertical) -> scrollbar creating methods with their auto_hide argument
+_OVERFLOW_ACTIONS = {
+    (False, False): (),
+    (True, False): (("_make_hor_scroll", False),),
+    (False, True): (("_make_vert_scroll", False),),
+    (True, True): (("_make_hor_scroll", False), ("_make_vert_scroll", False)),
+    ("auto", False): (("_make_hor_scroll", True),),
+    (False, "auto"): (("_make_vert_scroll", True),),
+    ("auto", True): (("_make_hor_scroll", True), ("_make_vert_scroll", False)),
+    (True, "auto"): (("_make_hor_scroll", False), ("_make_vert_scroll", True)),
+    ("auto", "auto"): (("_make_hor_scroll", True), ("_make_vert_scroll", True)),
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_index(line: int, column: int) -> str:
+    return f"{line}.{column}"
+
+
+def _parse_index(string: str) -> tuple[int, int]:
+    line, _, column = string.partition(".")
+    return int(line), int(column)
+
 
 class Tag(CgetAndConfigure, metaclass=ClassPropertyMetaClass):
     _widget: TextBox
+    __slots__ = "_name"
     _keys = {
         "bg_color": (Color, "background"),
         "fg_color": (Color, "foreground"),
@@ -52,6 +199,7 @@ class Tag(CgetAndConfigure, metaclass=ClassPropertyMetaClass):
         "underline_color": (Color, "underlinefg"),
         "wrap": _wraps,
     }
+    _key_set = frozenset(_keys)
 
     def __init__(
         self,
@@ -114,13 +262,13 @@ class Tag(CgetAndConfigure, metaclass=ClassPropertyMetaClass):
         return f"<tukaan.TextBox.Tag named {self._name!r}>"
 
     def __setattr__(self, key: str, value: Any) -> None:
-        if key in self._keys.keys():
+        if key in Tag._key_set:
             self.config(**{key: value})
         else:
             super().__setattr__(key, value)
 
     def __getattr__(self, key: str) -> Any:
-        if key in self._keys.keys():
+        if key in Tag._key_set:
             return self._cget(key)
         else:
             return super().__getattribute__(key)
@@ -154,10 +302,17 @@ class Tag(CgetAndConfigure, metaclass=ClassPropertyMetaClass):
 
     @property
     def ranges(self):
-        result = self._tcl_call((self._widget.index,), self, "ranges")
+        widget = self._widget
+
+        with widget._cached_end():
+            # Tcl returns "line.column" indexes, no need to resolve them with another Tcl call
+            result = [
+                widget.index(*_parse_index(index))
+                for index in self._tcl_call([str], self, "ranges")
+            ]
+            ranges = [tuple.__new__(widget.range, pair) for pair in zip(result[0::2], result[1::2])]
 
-        for start, end in zip(result[0::2], result[1::2]):
-            yield self._widget.range(start, end)
+        yield from ranges
 
     def _prev_next_range(
         self, direction: str, start: TextIndex, end: Optional[TextIndex] = None
@@ -207,17 +362,18 @@ class Tag(CgetAndConfigure, metaclass=ClassPropertyMetaClass):
 class TextIndex(namedtuple("TextIndex", ["line", "column"])):
     _widget: TextBox
     __slots__ = ()
+    __hash__ = tuple.__hash__  # defining __eq__ would make it unhashable otherwise
 
     def __new__(cls, *index, no_check=False) -> TextIndex:
         result = None
 
-        if isinstance(index, tuple) and len(index) == 2:
-            # line and column numbers
+        if len(index) == 2:
+            # line and column numbers (`index` is always a tuple here, since it's *args)
             line, col = index
         else:
             index = index[0]
             if isinstance(index, int):
-                if index in {0, 1}:
+                if index == 0 or index == 1:
                     line, col = 1, 0
                 elif index == -1:
                     result = cls._widget._tcl_call(
@@ -235,7 +391,7 @@ class TextIndex(namedtuple("TextIndex", ["line", "column"])):
                 raise TypeError
 
         if result:
-            line, col = tuple(map(int, result.split(".")))
+            line, col = _parse_index(result)
 
         if not no_check:
             if (line, col) < tuple(cls._widget.start):
@@ -246,7 +402,7 @@ class TextIndex(namedtuple("TextIndex", ["line", "column"])):
         return super(TextIndex, cls).__new__(cls, line, col)  # type: ignore
 
     def to_tcl(self) -> str:
-        return f"{self.line}.{self.column}"
+        return _format_index(self.line, self.column)
 
     @classmethod
     def from_tcl(cls, string: str) -> TextIndex:
@@ -258,18 +414,28 @@ class TextIndex(namedtuple("TextIndex", ["line", "column"])):
     def __eq__(self, other: TextIndex) -> bool:  # type: ignore[override]
         if not isinstance(other, TextIndex):
             return NotImplemented
-        return self._compare(other, "==")
+        # compares the stored (line, column) pairs without asking Tcl. Columns past the end of the
+        # line aren't clamped, so TextBox.index(1, 999) isn't equal to the index of the line end
+        return tuple.__eq__(self, other)
 
     def __lt__(self, other: TextIndex) -> bool:  # type: ignore[override]
+        if isinstance(other, TextIndex):
+            return tuple.__lt__(self, other)
         return self._compare(other, "<")
 
     def __gt__(self, other: TextIndex) -> bool:  # type: ignore[override]
+        if isinstance(other, TextIndex):
+            return tuple.__gt__(self, other)
         return self._compare(other, ">")
 
     def __le__(self, other: TextIndex) -> bool:  # type: ignore[override]
+        if isinstance(other, TextIndex):
+            return tuple.__le__(self, other)
         return self._compare(other, "<=")
 
     def __ge__(self, other: TextIndex) -> bool:  # type: ignore[override]
+        if isinstance(other, TextIndex):
+            return tuple.__ge__(self, other)
         return self._compare(other, ">=")
 
     def __add__(self, indices: int) -> TextIndex:  # type: ignore[override]
@@ -286,15 +452,18 @@ class TextIndex(namedtuple("TextIndex", ["line", "column"])):
         return self
 
     def _move(self, dir, chars, indices, lines):
-        move_str = ""
+        if not (chars or indices or lines):
+            return self
+
+        parts = [self.to_tcl()]
         if chars:
-            move_str += f" {dir} {chars} chars"
+            parts.append(f"{dir} {chars} chars")
         if indices:
-            move_str += f" {dir} {indices} indices"
+            parts.append(f"{dir} {indices} indices")
         if lines:
-            move_str += f" {dir} {lines} lines"
+            parts.append(f"{dir} {lines} lines")
 
-        return self.from_tcl(self.to_tcl() + move_str).clamp()
+        return self.from_tcl(" ".join(parts)).clamp()
 
     def forward(self, chars: int = 0, indices: int = 0, lines: int = 0) -> TextIndex:
         return self._move("+", chars, indices, lines)
@@ -322,6 +491,9 @@ class TextIndex(namedtuple("TextIndex", ["line", "column"])):
         return self._apply_suffix("wordend")
 
 
+_START = TextIndex(1, 0, no_check=True)
+
+
 class TextRange(namedtuple("TextRange", ["start", "end"])):
     _widget: TextBox
 
@@ -368,16 +540,17 @@ class TextMarks(abc.MutableMapping):
         return len(self.__get_names())
 
     def __contains__(self, mark: object) -> bool:
-        return mark in self.__get_names()
+        # the proc returns 0 or 1, converting it as bool would ask Tcl for its string form
+        return bool(self._widget._tcl_call(int, "::tukaan::has_mark", self._widget, mark))
 
     def __setitem__(self, name: str, index: TextIndex) -> None:
         self._widget._tcl_call(None, self._widget.tcl_path, "mark", "set", name, index)
 
     def __getitem__(self, name: str) -> TextIndex | None:
-        if name not in self.__get_names():
+        result = self._widget._tcl_call(str, "::tukaan::mark_index", self._widget, name)
+        if not result:
             return None
-
-        return self._widget.index(name)
+        return self._widget.index(*_parse_index(result))
 
     def __delitem__(self, name: str) -> None:
         if name == "insert":
@@ -389,14 +562,22 @@ class TextHistory:
     _widget: TextBox
     __slots__ = "_widget"
 
-    def call_subcommand(self, *args):
+    def _warn_if_disabled(self) -> None:
         if self._widget.track_history is False:
             warnings.warn(
                 "undoing is disabled on this textbox widget. Use `track_history=True` to enable it.",
-                stacklevel=3,
+                stacklevel=4,
             )
+
+    def call_subcommand(self, *args):
+        self._warn_if_disabled()
         return self._widget._tcl_call(bool, self._widget, "edit", *args)
 
+    def _repeat_subcommand(self, subcommand: str, number: int) -> None:
+        # loop inside Tcl, so undoing/redoing n steps is a single call
+        self._warn_if_disabled()
+        self._widget._tcl_call(None, "::tukaan::repeat_edit", self._widget, subcommand, number)
+
     @property
     def can_redo(self):
         return self.call_subcommand("canredo")
@@ -406,20 +587,12 @@ class TextHistory:
         return self.call_subcommand("canundo")
 
     def redo(self, number=1):
-        try:
-            for i in range(number):
-                self.call_subcommand("redo")
-        except TclError:
-            return
+        self._repeat_subcommand("redo", number)
 
     __rshift__ = redo
 
     def undo(self, number=1):
-        try:
-            for i in range(number):
-                self.call_subcommand("undo")
-        except TclError:
-            return
+        self._repeat_subcommand("undo", number)
 
     __lshift__ = undo
 
@@ -452,6 +625,80 @@ RangeInfo = namedtuple(
         "height",
     ],
 )
+_LINEINFO_TYPES = (int,) * 5
+_RANGEINFO_OPTIONS = {
+    "chars": ("-chars", int),
+    "displayed_chars": ("-displaychars", int),
+    "displayed_indices": ("-displayindices", int),
+    "displayed_lines": ("-displaylines", int),
+    "indices": ("-indices", int),
+    "lines": ("-lines", int),
+    "width": ("-xpixels", int),
+    "height": ("-ypixels", int),
+}
+
+
+def _range_info_options(metrics: Optional[tuple[str, ...]]) -> tuple[tuple, tuple, tuple]:
+    if metrics is None:
+        metrics = RangeInfo._fields
+    elif not metrics:
+        raise ValueError("at least one metric is required")
+
+    try:
+        options, types = zip(*(_RANGEINFO_OPTIONS[metric] for metric in metrics))
+    except KeyError as e:
+        raise ValueError(f"invalid metric: {e.args[0]!r}") from None
+
+    return metrics, options, types
+
+
+def _make_range_info(metrics: tuple[str, ...], result: tuple) -> RangeInfo:
+    values = dict(zip(metrics, result))
+
+    # Tk counts pixels as plain numbers, so make the ScreenDistances like line_info() does
+    for metric in ("width", "height"):
+        if metric in values:
+            values[metric] = ScreenDistance(values[metric])
+
+    return RangeInfo._make(map(values.get, RangeInfo._fields))
+
+
+_CONTENT_CONVERT = {
+    "image": _images.__getitem__,
+    "mark": "TextBox.marks[{!r}]".format,
+    "window": TkWidget.from_tcl,
+}
+
+
+def _parse_content(widget: TextBox, dump: tuple[str, ...]) -> list:
+    result: list = []
+    unclosed_tags: dict[str, tuple[TextIndex, int]] = {}
+    append = result.append
+    get_tag = _text_tags.__getitem__  # same as Tag.from_tcl, without the classmethod lookup
+    index_cls, range_cls = widget.index, widget.range
+    items = iter(dump)
+
+    for type, value, index_str in zip(items, items, items):
+        # dump gives "line.column" indexes, so they can be parsed without calling Tcl
+        index = index_cls(*_parse_index(index_str))
+
+        # text is by far the most common item, so check it first
+        if type == "text":
+            append(index)
+            append(value)
+            continue
+        elif type == "tagon":
+            unclosed_tags[value] = (index, len(result))
+            continue
+        elif type == "tagoff" and value in unclosed_tags:
+            start, position = unclosed_tags[value]
+            result.insert(position, (tuple.__new__(range_cls, (start, index)), get_tag(value)))
+            continue
+
+        append(index)
+        append(_CONTENT_CONVERT[type](value))
+
+    return result
 
 
 class _textbox_frame(BaseWidget):
@@ -552,7 +799,10 @@ class TextBox(BaseWidget):
         if cursor_ontime is not None:
             cursor_ontime = int(1000 * cursor_ontime)
 
+        _define_tcl_procs()
+
         self.peer_of = _peer_of
+        self._end_cache: TextIndex | None = None
 
         to_call = {
             "autoseparators": True,
@@ -600,9 +850,11 @@ class TextBox(BaseWidget):
 
         self._tcl_eval(
             None,
-            f"grid rowconfigure {self._frame.tcl_path} 0 -weight 1 \n"
-            + f"grid columnconfigure {self._frame.tcl_path} 0 -weight 1 \n"
-            + f"grid {self.tcl_path} -row 0 -column 0 -sticky nsew",
+            f"grid rowconfigure {self._frame.tcl_path} 0 -weight 1"
+            "\n"
+            f"grid columnconfigure {self._frame.tcl_path} 0 -weight 1"
+            "\n"
+            f"grid {self.tcl_path} -row 0 -column 0 -sticky nsew",
         )
         if overflow is not None:
             self.overflow = overflow
@@ -636,12 +888,29 @@ class TextBox(BaseWidget):
 
     @property
     def start(self) -> TextIndex:
-        return self.index(0, no_check=True)
+        return _START
 
     @property
     def end(self) -> TextIndex:
+        if self._end_cache is not None:
+            return self._end_cache
         return self.index(-1, no_check=True)
 
+    @contextlib.contextmanager
+    def _cached_end(self):
+        # every TextIndex asks for the end index to clamp itself, which is a Tcl call.
+        # When creating lots of them at once, the end can be fetched only once,
+        # but the text must not change inside the with block
+        if self._end_cache is not None:
+            yield
+            return
+
+        self._end_cache = self.end
+        try:
+            yield
+        finally:
+            self._end_cache = None
+
     @property
     def current(self) -> TextIndex:
         return self.marks["insert"]
@@ -674,7 +943,7 @@ class TextBox(BaseWidget):
             align = kwargs.pop("align", None)
 
             # fmt: off
-            to_call = ("image", "create", index, *py_to_tcl_arguments(image=content, padx=padx, pady=pady, align=align))
+            to_call = (self, "image", "create", index, *py_to_tcl_arguments(image=content, padx=padx, pady=pady, align=align))
             # fmt: on
         elif isinstance(content, TkWidget):
             margin = kwargs.pop("margin", None)
@@ -696,35 +965,42 @@ class TextBox(BaseWidget):
                 align = None
 
             # fmt: off
-            to_call = ("window", "create", index, *py_to_tcl_arguments(window=content, padx=padx, pady=pady, align=align, stretch=stretch))
+            to_call = (self, "window", "create", index, *py_to_tcl_arguments(window=content, padx=padx, pady=pady, align=align, stretch=stretch))
             # fmt: on
         elif isinstance(content, Path):
-            with open(str(content.resolve())) as file:
-                to_call = ("insert", index, file.read())
+            to_call = ("::tukaan::insert_file", self, index, content)
         else:
-            to_call = ("insert", index, content)
+            to_call = (self, "insert", index, content)
 
         if kwargs:
             raise TypeError(f"insert() got unexpected keyword argument(s): {tuple(kwargs.keys())}")
-        self._tcl_call(None, self, *to_call)
+
+        try:
+            self._tcl_call(None, *to_call)
+        except TclError as e:
+            reason = str(e).rpartition(": ")[2]
+            if not isinstance(content, Path) or reason not in _FILE_ERRORS:
+                raise
+            # OSError picks the matching subclass, like FileNotFoundError, from the errno code
+            code = _FILE_ERRORS[reason]
+            raise OSError(code, os.strerror(code), str(content)) from None
 
     def _get_tcl_index_range(self, indexes):
         if len(indexes) == 1:
             index_or_range = indexes[0]
 
             if isinstance(index_or_range, self.range):
-                return tuple(index.to_tcl() for index in index_or_range)
+                return index_or_range.start.to_tcl(), index_or_range.end.to_tcl()
             elif isinstance(index_or_range, self.index):
                 return index_or_range.to_tcl(), index_or_range.forward(chars=1).to_tcl()
             elif isinstance(index_or_range, tuple):
-                return (
-                    self.index(*index_or_range).to_tcl(),
-                    self.index(*index_or_range).forward(chars=1).to_tcl(),
-                )
+                index = self.index(*index_or_range)
+                return index.to_tcl(), index.forward(chars=1).to_tcl()
         elif len(indexes) == 2:
-            return tuple(index.to_tcl() for index in self.range(*indexes))
+            start, end = self.range(*indexes)
+            return start.to_tcl(), end.to_tcl()
         else:
-            return "1.0", "end - 1 chars"
+            return _FULL_RANGE
 
     def delete(self, *indexes) -> None:
         self._tcl_call(None, self, "delete", *self._get_tcl_index_range(indexes))
@@ -770,39 +1046,35 @@ class TextBox(BaseWidget):
         if stop == self.end:
             stop = "end - 1 chars"
 
-        if variable is None:
-            variable = Integer()
-
-        to_call: list[str] = []
-
-        if backwards:
-            to_call += "-backwards"
-        if not case_sensitive:
-            to_call += "-nocase"
-        if count_hidden:
-            to_call += "-elide"
-        if exact:
-            to_call += "-exact"
-        if forwards:
-            to_call += "-forwards"
-        if match_newline:
-            to_call += "-nolinestop"
-        if regex:
-            to_call += "-regexp"
-        if strict_limits:
-            to_call += "-strictlimits"
+        flags = {
+            "backwards": backwards,
+            "case_sensitive": case_sensitive,
+            "count_hidden": count_hidden,
+            "exact": exact,
+            "forwards": forwards,
+            "match_newline": match_newline,
+            "regex": regex,
+            "strict_limits": strict_limits,
+        }
+        to_call = [
+            flag for name, flag, inverted in _SEARCH_FLAGS if bool(flags[name]) is not inverted
+        ]
 
         if pattern and pattern[0] == "-":
-            to_call += "--"
+            to_call.append("--")
 
-        while True:
+        with self._cached_end():
             result = self._tcl_call(
-                str, self.tcl_path, "search", "-count", variable, *to_call, pattern, start, stop
+                [str], "::tukaan::search_all", self, variable, to_call, pattern, start, stop
             )
-            if not result:
-                break
-            yield self.range(self.index(result), self.index(result).forward(chars=variable.get()))  # type: ignore
-            start = result + "+ 1 chars"
+            matches = [
+                self.range(
+                    self.index(*_parse_index(match_start)), self.index(*_parse_index(match_end))
+                )
+                for match_start, match_end in zip(result[0::2], result[1::2])
+            ]
+
+        yield from matches
 
     def scroll_to(self, index: TextIndex) -> None:
         self._tcl_call(None, self, "see", index)
@@ -827,30 +1099,13 @@ class TextBox(BaseWidget):
         if len(new_overflow) == 1:
             new_overflow = (new_overflow[0], new_overflow[0])
 
-        if new_overflow == (False, False):
-            pass
-        elif new_overflow == (True, False):
-            self._make_hor_scroll(False)
-        elif new_overflow == (False, True):
-            self._make_vert_scroll(False)
-        elif new_overflow == (True, True):
-            self._make_hor_scroll(False)
-            self._make_vert_scroll(False)
-        elif new_overflow == ("auto", False):
-            self._make_hor_scroll()
-        elif new_overflow == (False, "auto"):
-            self._make_vert_scroll()
-        elif new_overflow == ("auto", True):
-            self._make_hor_scroll()
-            self._make_vert_scroll(False)
-        elif new_overflow == (True, "auto"):
-            self._make_hor_scroll(False)
-            self._make_vert_scroll()
-        elif new_overflow == ("auto", "auto"):
-            self._make_hor_scroll()
-            self._make_vert_scroll()
-        else:
-            raise ValueError(f"invalid overflow value: {new_overflow}")
+        try:
+            actions = _OVERFLOW_ACTIONS[new_overflow]
+        except (KeyError, TypeError):
+            raise ValueError(f"invalid overflow value: {new_overflow}") from None
+
+        for method, auto_hide in actions:
+            getattr(self, method)(auto_hide)
 
         self._overflow = new_overflow
 
@@ -865,78 +1120,75 @@ class TextBox(BaseWidget):
 
     @property
     def content(self) -> list[tuple[TextIndex, str | Tag | Icon | Image.Image | TkWidget]]:
-        result = []  # type: ignore
-        unclosed_tags = {}
-
-        def add_item(type: str, value: str, index: str) -> None:
-            nonlocal result
-            nonlocal unclosed_tags
-
-            if type == "tagon":
-                unclosed_tags[value] = (index, len(result))
-                return
-            elif type == "tagoff":
-                if value in unclosed_tags:
-                    result.insert(
-                        unclosed_tags[value][1],
-                        (
-                            self.range(self.index(unclosed_tags[value][0]), self.index(index)),
-                            Tag.from_tcl(value),
-                        ),
-                    )
-                    return
-
-            convert = {
-                "image": lambda x: _images[x],
-                "mark": lambda x: f"TextBox.marks[{x!r}]",
-                "text": str,
-                "window": TkWidget.from_tcl,
-            }[type]
-
-            result += (self.index(index), convert(value))  # type: ignore  # "object" not callable
-
-        self._tcl_call(str, self, "dump", "-all", "-command", add_item, "1.0", "end - 1 chars")
-        return result
+        # get the whole dump as a flat list in one call, instead of Tcl calling back for each item,
+        # and split it at once, instead of converting every item with from_tcl()
+        dump = get_tcl_interp()._split_list(
+            self._tcl_call("noconvert", self, "dump", "-all", "1.0", "end - 1 chars")
+        )
+        with self._cached_end():
+            return _parse_content(self, dump)
 
     @update_before
     def line_info(self, index: TextIndex) -> LineInfo:
         """Returns the accurate height only if the TextBox widget has already laid out"""
-        result = self._tcl_call(
-            (ScreenDistance, ScreenDistance, ScreenDistance, ScreenDistance, ScreenDistance),
-            self,
-            "dlineinfo",
-            index,
-        )
+        result = self._tcl_call(_LINEINFO_TYPES, self, "dlineinfo", index)
 
-        return LineInfo(*result)
+        return LineInfo(*map(ScreenDistance, result))
 
-    def range_info(self, *indexes) -> RangeInfo:
-        result = self._tcl_call(
-            (int, int, int, int, int, int, ScreenDistance, ScreenDistance),
-            self,
-            "count",
-            "-chars",
-            "-displaychars",
-            "-displayindices",
-            "-displaylines",
-            "-indices",
-            "-lines",
-            "-xpixels",
-            "-ypixels",
-            *self._get_tcl_index_range(indexes),
-        )
+    def range_info(self, *indexes, metrics: Optional[tuple[str, ...]] = None) -> RangeInfo:
+        """Fields not listed in metrics are None. Omit it to get every metric"""
+        metrics, options, types = _range_info_options(metrics)
+
+        # Tk has to lay out the text for some of them, so only ask for the needed ones
+        index_range = self._get_tcl_index_range(indexes)
+        if len(options) == 1:
+            # with a single option, Tk returns the number itself, not a list
+            result = (self._tcl_call(types[0], self, "count", *options, *index_range),)
+        else:
+            result = self._tcl_call(types, self, "count", *options, *index_range)
+
+        return _make_range_info(metrics, result)
+
+    def range_info_many(
+        self, ranges: Iterable[TextRange | TextIndex], metrics: Optional[tuple[str, ...]] = None
+    ) -> list[RangeInfo]:
+        """Same as range_info() for each range, but with a single Tcl call"""
+        metrics, options, types = _range_info_options(metrics)
+        indexes = []
+        for text_range in ranges:
+            if isinstance(text_range, self.range):
+                indexes.extend((text_range.start.to_tcl(), text_range.end.to_tcl()))
+            else:
+                # let Tcl find the next character, TextIndex.forward() would need a call for each
+                index = text_range.to_tcl()
+                indexes.extend((index, f"{index} + 1 chars"))
+
+        if len(options) == 1:
+            # with a single option, each count is a number, not a list
+            values = self._tcl_call([types[0]], "::tukaan::count_many", self, options, indexes)
+            result = [(value,) for value in values]
+        else:
+            result = self._tcl_call([types], "::tukaan::count_many", self, options, indexes)
 
-        return RangeInfo(*result)
+        return [_make_range_info(metrics, values) for values in result]
 
     def __matmul__(self, index: tuple[int, int] | int | Icon | Image.Image | TkWidget):
         return self.index(index)
 
     def __contains__(self, text: str):
-        return text in self.get()
+        if not text:
+            return True
+
+        # let Tk search the text, instead of copying the whole content to Python
+        return bool(
+            self._tcl_call(str, self, "search", "-elide", "-strictlimits", "--", text, *_FULL_RANGE)
+        )
 
     def __getitem__(self, index: slice | tuple | TextBox.index):
-        if isinstance(index, slice):
+        index_type = type(index)
+        if index_type is slice:
             return self.get(self.range(index))
-        elif isinstance(index, (tuple, self.index)):
+        elif index_type is tuple or index_type is TextIndex or isinstance(index, tuple):
+            # exact type checks first, isinstance only for other tuple subclasses (TextRange)
             return self.get(index)
         raise TypeError("expected a tuple, a slice or a `TextBox.index` object")